@@ -1,12 +1,17 @@
+import re
+
+from functools import lru_cache
+
 import param
 import numpy as np
 import matplotlib
 
 from matplotlib import patches as patches
+from matplotlib.axis import GRIDLINE_INTERPOLATION_STEPS
 from matplotlib.lines import Line2D
 
 from ...core.util import match_spec
-from ...core.options import abbreviated_exception
+from ...core.options import AbbreviatedException, abbreviated_exception
 from .element import ElementPlot, ColorbarPlot
 from .plot import mpl_rc_context
 
@@ -27,8 +32,7 @@ class ABLine2D(Line2D):
         self._intercept = intercept
         ax.add_line(self)
 
-        # cache the renderer, draw the line for the first time
-        ax.figure.canvas.draw()
+        # compute the initial line, it is rendered on the next draw
         self._update_lim(None)
 
         # connect to axis callbacks
@@ -37,10 +41,63 @@ class ABLine2D(Line2D):
 
     def _update_lim(self, event):
         """ called whenever axis x/y limits change """
-        x = np.array(self.axes.get_xbound())
-        y = (self._slope * x) + self._intercept
-        self.set_data(x, y)
-        self.axes.draw_artist(self)
+        x0, x1 = self.axes.get_xbound()
+        y0 = self._slope * x0 + self._intercept
+        y1 = self._slope * x1 + self._intercept
+        self.set_data((x0, x1), (y0, y1))
+
+
+def _span_vertices(axis, positions, horizontal):
+    """
+    Returns the vertices of a span between the supplied positions,
+    spanning the full extent of the other axis in axes coordinates.
+    Like axvspan/axhspan the positions may have units, e.g. datetimes,
+    which are registered on the axis and converted.
+    """
+    positions = list(positions)
+    if horizontal:
+        axis.yaxis.update_units(positions)
+        start, end = axis.convert_yunits(positions)
+        return [(0, start), (0, end), (1, end), (1, start), (0, start)]
+    axis.xaxis.update_units(positions)
+    start, end = axis.convert_xunits(positions)
+    return [(start, 0), (start, 1), (end, 1), (end, 0), (start, 0)]
+
+
+def _draw_span(axis, positions, opts, horizontal):
+    """
+    Draws a span Polygon equivalent to axvspan/axhspan which may be
+    updated in place by setting its vertices.
+    """
+    if horizontal:
+        transform = axis.get_yaxis_transform()
+    else:
+        transform = axis.get_xaxis_transform()
+    span = patches.Polygon([(0, 0)], transform=transform, **opts)
+    _set_span_vertices(span, axis, positions, horizontal)
+    axis.add_patch(span)
+    return span
+
+
+def _set_span_vertices(span, axis, positions, horizontal):
+    """
+    Sets the vertices of a span Polygon, interpolating the path like
+    axvspan/axhspan so the span follows curved axes.
+    """
+    span.set_xy(_span_vertices(axis, positions, horizontal))
+    span.get_path()._interpolation_steps = GRIDLINE_INTERPOLATION_STEPS
+
+
+@lru_cache(maxsize=32)
+def _spline_path(dtype, shape, verts, codes):
+    """
+    Constructs a read-only Path from the raw bytes of the spline
+    vertices and codes, caching it so that identical splines redrawn
+    on each frame share a single Path.
+    """
+    verts = np.frombuffer(verts, dtype=dtype).reshape(shape)
+    codes = np.frombuffer(codes, dtype=matplotlib.path.Path.code_type)
+    return matplotlib.path.Path(verts, codes, readonly=True)
 
 
 class AnnotationPlot(ElementPlot):
@@ -55,6 +112,7 @@ class AnnotationPlot(ElementPlot):
         self._annotation = annotation
         super().__init__(annotation, **params)
         self.handles['annotations'] = []
+        self._annotation_state = None
 
     @mpl_rc_context
     def initialize_plot(self, ranges=None):
@@ -64,18 +122,66 @@ class AnnotationPlot(ElementPlot):
         ranges = match_spec(annotation, ranges)
         axis = self.handles['axis']
         opts = self.style[self.cyclic_index]
-        with abbreviated_exception():
-            handles = self.draw_annotation(axis, annotation.data, opts)
+        state = self._get_annotation_state(opts)
+        handles = self._draw_annotation(axis, annotation.data, opts)
         self.handles['annotations'] = handles
+        self._annotation_state = state
         return self._finalize_axis(key, element=annotation, ranges=ranges)
 
     def update_handles(self, key, axis, annotation, ranges, style):
+        # Update existing annotation in place if the styling is unchanged
+        handles = self.handles['annotations']
+        state = self._get_annotation_state(style)
+        if (len(handles) == 1 and self._same_annotation_state(state) and
+            self._update_artist(handles[0], annotation.data)):
+            return
+
         # Clear all existing annotations
-        for element in self.handles['annotations']:
+        for element in handles:
             element.remove()
 
-        with abbreviated_exception():
-            self.handles['annotations'] = self.draw_annotation(axis, annotation.data, style)
+        self.handles['annotations'] = self._draw_annotation(axis, annotation.data, style)
+        self._annotation_state = state
+
+    def _get_annotation_state(self, style):
+        """
+        Returns the state which determines whether the annotation
+        artists may be updated in place, ignoring the label and zorder
+        which update_frame adds to the style.
+        """
+        style = {k: v for k, v in style.items() if k not in ('label', 'zorder')}
+        return (self.invert_axes, style)
+
+    def _same_annotation_state(self, state):
+        """
+        Compares the supplied state against the state of the current
+        annotation artists, supporting array valued style options.
+        """
+        previous = self._annotation_state
+        if previous is None or previous[0] != state[0]:
+            return False
+        prev_style, style = previous[1], state[1]
+        if prev_style.keys() != style.keys():
+            return False
+        return all(np.array_equal(prev_style[k], v) for k, v in style.items())
+
+    def _draw_annotation(self, axis, data, opts):
+        """
+        Calls draw_annotation, abbreviating the traceback of any errors
+        like abbreviated_exception without entering a context manager
+        on every frame.
+        """
+        try:
+            return self.draw_annotation(axis, data, opts)
+        except Exception as e:
+            raise AbbreviatedException(type(e), e, e.__traceback__)
+
+    def _update_artist(self, artist, data):
+        """
+        Updates an existing artist in place with the supplied
+        annotation data, returning whether the update was possible.
+        """
+        return False
 
 
 class VLinePlot(AnnotationPlot):
@@ -89,6 +195,13 @@ class VLinePlot(AnnotationPlot):
         else:
             return [axis.axvline(position, **opts)]
 
+    def _update_artist(self, artist, position):
+        if self.invert_axes:
+            artist.set_ydata([position, position])
+        else:
+            artist.set_xdata([position, position])
+        return True
+
 
 class HLinePlot(AnnotationPlot):
     "Draw a horizontal line on the axis"
@@ -102,6 +215,13 @@ class HLinePlot(AnnotationPlot):
         else:
             return [axis.axhline(position, **opts)]
 
+    def _update_artist(self, artist, position):
+        if self.invert_axes:
+            artist.set_xdata([position, position])
+        else:
+            artist.set_ydata([position, position])
+        return True
+
 
 class VSpanPlot(AnnotationPlot):
     "Draw a vertical span on the axis"
@@ -111,10 +231,11 @@ class VSpanPlot(AnnotationPlot):
 
     def draw_annotation(self, axis, positions, opts):
         "Draw a vertical span on the axis"
-        if self.invert_axes:
-            return [axis.axhspan(*positions, **opts)]
-        else:
-            return [axis.axvspan(*positions, **opts)]
+        return [_draw_span(axis, positions, opts, self.invert_axes)]
+
+    def _update_artist(self, artist, positions):
+        _set_span_vertices(artist, artist.axes, positions, self.invert_axes)
+        return True
 
 
 class HSpanPlot(AnnotationPlot):
@@ -125,10 +246,11 @@ class HSpanPlot(AnnotationPlot):
 
     def draw_annotation(self, axis, positions, opts):
         "Draw a horizontal span on the axis"
-        if self.invert_axes:
-            return [axis.axvspan(*positions, **opts)]
-        else:
-            return [axis.axhspan(*positions, **opts)]
+        return [_draw_span(axis, positions, opts, not self.invert_axes)]
+
+    def _update_artist(self, artist, positions):
+        _set_span_vertices(artist, artist.axes, positions, not self.invert_axes)
+        return True
 
 
 class SlopePlot(AnnotationPlot):
@@ -186,14 +308,31 @@ class LabelsPlot(ColorbarPlot):
         with abbreviated_exception():
             style = self._apply_transforms(element, ranges, style)
 
-        xs, ys = (element.dimension_values(i) for i in range(2))
+        xs = element.dimension_values(0)
+        ys = element.dimension_values(1)
         tdim = element.get_dimension(2)
-        text = [tdim.pprint_value(v) for v in element.dimension_values(tdim)]
-        positions = (ys, xs) if self.invert_axes else (xs, ys)
+        tvals = element.dimension_values(tdim)
+        if isinstance(tvals, np.ndarray):
+            kind = tvals.dtype.kind
+            own_type = tvals.dtype.type if tdim.type is None else tdim.type
+            formatter = tdim.value_format or tdim.type_formatters.get(own_type)
+        else:
+            kind, formatter = 'O', None
+        if kind in 'biufU' and formatter is None:
+            # Without a formatter values are simply converted to strings
+            text = tvals.astype(str)
+        elif (kind in 'iuf' and isinstance(formatter, str) and
+              not re.findall(r"\{(\w+)\}", formatter)):
+            # Apply printf-style formatters to all values at once
+            text = np.char.mod(formatter, tvals)
+        else:
+            text = [tdim.pprint_value(v) for v in tvals]
+        # Offsets allocate new arrays to avoid mutating the element data
         if self.xoffset is not None:
-            xs += self.xoffset
+            xs = xs + self.xoffset
         if self.yoffset is not None:
-            ys += self.yoffset
+            ys = ys + self.yoffset
+        positions = (ys, xs) if self.invert_axes else (xs, ys)
 
         cs = None
         cdim = element.get_dimension(self.color_index)
@@ -203,35 +342,43 @@ class LabelsPlot(ColorbarPlot):
         if 'c' in style:
             cs = style.pop('c')
 
+        # Map all colors through the colormap in a single call
+        colors = None
+        if cs is not None:
+            with abbreviated_exception():
+                cmap = style.pop('cmap', None)
+                vmin, vmax = style.pop('vmin'), style.pop('vmax')
+                if cmap is not None:
+                    if cs.dtype.kind in 'if':
+                        cs = (cs - vmin) / (vmax-vmin)
+                    else:
+                        # The inverse of the unique values indexes each color
+                        _, cs = np.unique(cs, return_inverse=True)
+                    colors = [tuple(c) for c in cmap(cs).tolist()]
+
         if 'size' in style: style['fontsize'] = style.pop('size')
         if 'horizontalalignment' not in style: style['horizontalalignment'] = 'center'
         if 'verticalalignment' not in style: style['verticalalignment'] = 'center'
-        return positions + (text, cs), style, {}
+        return positions + (text, colors), style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
-        if plot_args[-1] is not None:
-            cmap = plot_kwargs.pop('cmap', None)
-            colors = list(np.unique(plot_args[-1]))
-            vmin, vmax = plot_kwargs.pop('vmin'), plot_kwargs.pop('vmax')
-        else:
-            cmap = None
-            plot_args = plot_args[:-1]
-
+        xs, ys, text, colors = plot_args
         vectorized = {k: v for k, v in plot_kwargs.items() if isinstance(v, np.ndarray)}
+        kwargs = {k: v for k, v in plot_kwargs.items() if k not in vectorized}
+        if colors is not None:
+            vectorized['color'] = colors
+
+        if not vectorized:
+            # Uniformly styled labels all share the same kwargs
+            texts = [ax.text(x, y, t, **kwargs) for x, y, t in zip(xs, ys, text)]
+            return {'artist': texts}
 
+        # Write the per-label values into the shared kwargs in place
+        keys = list(vectorized)
         texts = []
-        for i, item in enumerate(zip(*plot_args)):
-            x, y, text = item[:3]
-            if len(item) == 4 and cmap is not None:
-                color = item[3]
-                if plot_args[-1].dtype.kind in 'if':
-                    color = (color - vmin) / (vmax-vmin)
-                    plot_kwargs['color'] = cmap(color)
-                else:
-                    color = colors.index(color) if color in colors else np.NaN
-                    plot_kwargs['color'] = cmap(color)
-            kwargs = dict(plot_kwargs, **{k: v[i] for k, v in vectorized.items()})
-            texts.append(ax.text(x, y, text, **kwargs))
+        for i, values in enumerate(zip(*vectorized.values())):
+            kwargs.update(zip(keys, values))
+            texts.append(ax.text(xs[i], ys[i], text[i], **kwargs))
         return {'artist': texts}
 
     def teardown_handles(self):
@@ -248,6 +395,9 @@ class ArrowPlot(AnnotationPlot):
 
     style_opts = sorted(set(_arrow_style_opts + _text_style_opts))
 
+    # Sign of the text offset from the arrow head for each direction
+    _arrow_directions = {'v': (0, 1), '^': (0, -1), '>': (-1, 0), '<': (1, 0)}
+
     def draw_annotation(self, axis, data, opts):
         x, y, text, direction, points, arrowstyle = data
         if self.invert_axes: x, y = y, x
@@ -255,10 +405,8 @@ class ArrowPlot(AnnotationPlot):
         arrowprops = dict({'arrowstyle':arrowstyle},
                           **{k: opts[k] for k in self._arrow_style_opts if k in opts})
         textopts = {k: opts[k] for k in self._text_style_opts if k in opts}
-        if direction in ['v', '^']:
-            xytext = (0, points if direction=='v' else -points)
-        elif direction in ['>', '<']:
-            xytext = (points if direction=='<' else -points, 0)
+        sx, sy = self._arrow_directions[direction]
+        xytext = (sx*points, sy*points)
         if 'fontsize' in textopts:
             self.param.warning('Arrow fontsize style option is deprecated, '
                                'use textsize option instead.')
@@ -275,11 +423,21 @@ class SplinePlot(AnnotationPlot):
 
     style_opts = ['alpha', 'edgecolor', 'linewidth', 'linestyle', 'visible']
 
+    # Maximum number of vertices for which the Path is cached
+    _path_cache_limit = 1000
+
     def draw_annotation(self, axis, data, opts):
         verts, codes = data
         if not len(verts):
             return []
-        patch = patches.PathPatch(matplotlib.path.Path(verts, codes),
-                                  facecolor='none', **opts)
+        verts = np.asarray(verts)
+        if (codes is not None and verts.dtype.kind in 'iuf' and
+            len(verts) <= self._path_cache_limit):
+            codes = np.asarray(codes, dtype=matplotlib.path.Path.code_type)
+            path = _spline_path(verts.dtype.str, verts.shape,
+                                verts.tobytes(), codes.tobytes())
+        else:
+            path = matplotlib.path.Path(verts, codes)
+        patch = patches.PathPatch(path, facecolor='none', **opts)
         axis.add_patch(patch)
         return [patch]
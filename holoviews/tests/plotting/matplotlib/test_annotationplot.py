@@ -0,0 +1,135 @@
+import datetime as dt
+
+import numpy as np
+
+from matplotlib.axis import GRIDLINE_INTERPOLATION_STEPS
+from matplotlib.dates import date2num
+
+from holoviews.core.spaces import HoloMap
+from holoviews.element import HLine, VLine, HSpan, VSpan, Slope, Spline
+
+from .test_plot import TestMPLPlot, mpl_renderer
+
+
+class TestHVLinePlot(TestMPLPlot):
+
+    def test_vline_plot(self):
+        vline = VLine(1.1)
+        plot = mpl_renderer.get_plot(vline)
+        line = plot.handles['annotations'][0]
+        self.assertEqual(np.asarray(line.get_xdata()), np.array([1.1, 1.1]))
+
+    def test_hline_plot(self):
+        hline = HLine(1.1)
+        plot = mpl_renderer.get_plot(hline)
+        line = plot.handles['annotations'][0]
+        self.assertEqual(np.asarray(line.get_ydata()), np.array([1.1, 1.1]))
+
+    def test_vline_update_in_place(self):
+        vlines = HoloMap({0: VLine(1.1), 1: VLine(2.2)})
+        plot = mpl_renderer.get_plot(vlines)
+        line = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], line)
+        self.assertEqual(np.asarray(line.get_xdata()), np.array([1.1, 1.1]))
+
+    def test_hline_invert_axes_update_in_place(self):
+        hlines = HoloMap({0: HLine(1.1), 1: HLine(2.2)}).opts(invert_axes=True)
+        plot = mpl_renderer.get_plot(hlines)
+        line = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], line)
+        self.assertEqual(np.asarray(line.get_xdata()), np.array([1.1, 1.1]))
+
+    def test_vline_array_color_update(self):
+        vlines = HoloMap({0: VLine(1.1), 1: VLine(2.2)}).opts(color=np.array([1, 0, 0]))
+        plot = mpl_renderer.get_plot(vlines)
+        line = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], line)
+        self.assertEqual(np.asarray(line.get_xdata()), np.array([1.1, 1.1]))
+
+
+class TestHVSpanPlot(TestMPLPlot):
+
+    def test_vspan_update_in_place(self):
+        vspans = HoloMap({0: VSpan(1, 2), 1: VSpan(3, 5)})
+        plot = mpl_renderer.get_plot(vspans)
+        span = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], span)
+        xs = span.get_xy()[:, 0]
+        self.assertEqual(xs.min(), 1)
+        self.assertEqual(xs.max(), 2)
+
+    def test_hspan_update_in_place(self):
+        hspans = HoloMap({0: HSpan(1, 2), 1: HSpan(3, 5)})
+        plot = mpl_renderer.get_plot(hspans)
+        span = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], span)
+        ys = span.get_xy()[:, 1]
+        self.assertEqual(ys.min(), 1)
+        self.assertEqual(ys.max(), 2)
+
+    def test_vspan_interpolation_steps(self):
+        vspans = HoloMap({0: VSpan(1, 2), 1: VSpan(3, 5)})
+        plot = mpl_renderer.get_plot(vspans)
+        span = plot.handles['annotations'][0]
+        self.assertEqual(span.get_path()._interpolation_steps, GRIDLINE_INTERPOLATION_STEPS)
+        plot.update((0,))
+        self.assertEqual(span.get_path()._interpolation_steps, GRIDLINE_INTERPOLATION_STEPS)
+
+    def test_vspan_datetime(self):
+        start, end = dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 3)
+        plot = mpl_renderer.get_plot(VSpan(start, end))
+        xs = plot.handles['annotations'][0].get_xy()[:, 0]
+        self.assertEqual(xs.min(), date2num(start))
+        self.assertEqual(xs.max(), date2num(end))
+
+    def test_hspan_datetime(self):
+        start, end = dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 3)
+        plot = mpl_renderer.get_plot(HSpan(start, end))
+        ys = plot.handles['annotations'][0].get_xy()[:, 1]
+        self.assertEqual(ys.min(), date2num(start))
+        self.assertEqual(ys.max(), date2num(end))
+
+    def test_vspan_datetime_update_in_place(self):
+        vspans = HoloMap({0: VSpan(dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 3)),
+                          1: VSpan(dt.datetime(2020, 1, 5), dt.datetime(2020, 1, 7))})
+        plot = mpl_renderer.get_plot(vspans)
+        span = plot.handles['annotations'][0]
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0], span)
+        xs = span.get_xy()[:, 0]
+        self.assertEqual(xs.min(), date2num(dt.datetime(2020, 1, 1)))
+        self.assertEqual(xs.max(), date2num(dt.datetime(2020, 1, 3)))
+
+
+class TestSlopePlot(TestMPLPlot):
+
+    def test_slope_plot(self):
+        slope = Slope(2, 1)
+        plot = mpl_renderer.get_plot(slope)
+        line = plot.handles['annotations'][0]
+        x0, x1 = plot.handles['axis'].get_xbound()
+        self.assertEqual(np.asarray(line.get_xdata()), np.array([x0, x1]))
+        self.assertEqual(np.asarray(line.get_ydata()), np.array([2*x0+1, 2*x1+1]))
+
+
+class TestSplinePlot(TestMPLPlot):
+
+    def test_spline_plot(self):
+        spline = Spline(([(0, 0), (1, 1), (2, 0)], [1, 3, 3]))
+        plot = mpl_renderer.get_plot(spline)
+        path = plot.handles['annotations'][0].get_path()
+        self.assertEqual(path.vertices, np.array([[0., 0.], [1., 1.], [2., 0.]]))
+        self.assertEqual(path.codes, np.array([1, 3, 3], dtype=np.uint8))
+
+    def test_spline_update_reuses_path(self):
+        splines = HoloMap({0: Spline(([(0, 0), (1, 1), (2, 0)], [1, 3, 3])),
+                           1: Spline(([(0, 0), (1, 1), (2, 0)], [1, 3, 3]))})
+        plot = mpl_renderer.get_plot(splines)
+        path = plot.handles['annotations'][0].get_path()
+        plot.update((0,))
+        self.assertIs(plot.handles['annotations'][0].get_path(), path)
@@ -39,6 +39,65 @@ class TestLabelsPlot(TestMPLPlot):
             self.assertEqual(text._y, expected['y'][i])
             self.assertEqual(text.get_text(), expected['text'][i])
 
+    def test_labels_int_text(self):
+        labels = Labels({'x': [0, 1], 'y': [1, 0], 'text': np.array([1, 20])},
+                        vdims='text')
+        plot = mpl_renderer.get_plot(labels)
+        artist = plot.handles['artist']
+        tdim = labels.get_dimension('text')
+        expected = [tdim.pprint_value(v) for v in labels.dimension_values('text')]
+        self.assertEqual(expected, ['1', '20'])
+        self.assertEqual([text.get_text() for text in artist], expected)
+
+    def test_labels_float_text(self):
+        labels = Labels({'x': [0, 1], 'y': [1, 0], 'text': np.array([1, 2.123456])},
+                        vdims='text')
+        plot = mpl_renderer.get_plot(labels)
+        artist = plot.handles['artist']
+        tdim = labels.get_dimension('text')
+        expected = [tdim.pprint_value(v) for v in labels.dimension_values('text')]
+        self.assertEqual(expected, ['1', '2.1235'])
+        self.assertEqual([text.get_text() for text in artist], expected)
+
+    def test_labels_bool_text(self):
+        labels = Labels({'x': [0, 1], 'y': [1, 0], 'text': np.array([True, False])},
+                        vdims='text')
+        plot = mpl_renderer.get_plot(labels)
+        artist = plot.handles['artist']
+        self.assertEqual([text.get_text() for text in artist], ['True', 'False'])
+
+    def test_labels_type_formatter(self):
+        labels = Labels({'x': [0, 1], 'y': [1, 0],
+                         'text': np.array([1, 2.5], dtype=np.float64)}, vdims='text')
+        previous = Dimension.type_formatters.get(np.float64)
+        Dimension.type_formatters[np.float64] = '%.2f'
+        try:
+            plot = mpl_renderer.get_plot(labels)
+        finally:
+            Dimension.type_formatters[np.float64] = previous
+        artist = plot.handles['artist']
+        self.assertEqual([text.get_text() for text in artist], ['1.00', '2.50'])
+
+    def test_labels_type_formatter_str_format(self):
+        labels = Labels({'x': [0, 1], 'y': [1, 0],
+                         'text': np.array([1, 2], dtype=np.int64)}, vdims='text')
+        previous = Dimension.type_formatters.get(np.int64)
+        Dimension.type_formatters[np.int64] = '{0} items'
+        try:
+            plot = mpl_renderer.get_plot(labels)
+        finally:
+            Dimension.type_formatters[np.int64] = previous
+        artist = plot.handles['artist']
+        self.assertEqual([text.get_text() for text in artist], ['1 items', '2 items'])
+
+    def test_labels_datetime_text(self):
+        dates = np.array(['2020-01-01', '2020-01-02'], dtype='datetime64[ns]')
+        labels = Labels({'x': [0, 1], 'y': [1, 0], 'text': dates}, vdims='text')
+        plot = mpl_renderer.get_plot(labels)
+        artist = plot.handles['artist']
+        self.assertEqual([text.get_text() for text in artist],
+                         ['2020-01-01 00:00:00', '2020-01-02 00:00:00'])
+
     def test_labels_inverted(self):
         labels = Labels([(0, 1, 'A'), (1, 0, 'B')]).options(invert_axes=True)
         plot = mpl_renderer.get_plot(labels)
@@ -49,6 +108,17 @@ class TestLabelsPlot(TestMPLPlot):
             self.assertEqual(text._y, expected['x'][i])
             self.assertEqual(text.get_text(), expected['Label'][i])
 
+    def test_labels_offset(self):
+        labels = Labels([(0, 1, 'A'), (1, 0, 'B')]).options(xoffset=0.5, yoffset=1)
+        plot = mpl_renderer.get_plot(labels)
+        artist = plot.handles['artist']
+        expected = {'x': np.array([0.5, 1.5]), 'y': np.array([2, 1])}
+        for i, text in enumerate(artist):
+            self.assertEqual(text._x, expected['x'][i])
+            self.assertEqual(text._y, expected['y'][i])
+        self.assertEqual(labels.dimension_values(0), np.array([0, 1]))
+        self.assertEqual(labels.dimension_values(1), np.array([1, 0]))
+
     def test_labels_color_mapped(self):
         labels = Labels([(0, 1, 0.33333), (1, 0, 0.66666)]).options(color_index=2)
         plot = mpl_renderer.get_plot(labels)